@@ -5,6 +5,7 @@ from __future__ import annotations
 from logging import DEBUG, Formatter, Logger, StreamHandler
 from sys import stdout
 from time import gmtime
+from typing import TextIO
 
 FORMATTER = Formatter(
     fmt="%(asctime)s\t%(name)s\t[%(levelname)s]\t%(message)s",
@@ -12,6 +13,8 @@ FORMATTER = Formatter(
 )
 FORMATTER.converter = gmtime
 
+_STREAM_HANDLERS: dict[int, StreamHandler[TextIO]] = {}
+
 
 def add_stream_handler(logger: Logger, *, level: int = DEBUG) -> Logger:
     """Add a StreamHandler to an existing logger.
@@ -25,9 +28,12 @@ def add_stream_handler(logger: Logger, *, level: int = DEBUG) -> Logger:
             `logger = add_stream_handler(logging.getLogger(__name__))`
     """
 
-    s_handler = StreamHandler(stdout)
-    s_handler.setFormatter(FORMATTER)
-    s_handler.setLevel(level)
+    # One handler per level is shared by every logger, and `addHandler` is a no-op
+    # for a handler that's already attached, so repeat calls don't stack handlers
+    if (s_handler := _STREAM_HANDLERS.get(level)) is None:
+        s_handler = _STREAM_HANDLERS[level] = StreamHandler(stdout)
+        s_handler.setFormatter(FORMATTER)
+        s_handler.setLevel(level)
 
     logger.addHandler(s_handler)
 
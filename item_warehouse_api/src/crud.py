@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import getenv
-from typing import TYPE_CHECKING, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 from _helpers import add_stream_handler
+from cachetools import TTLCache
 from database import GeneralItemModelType, SqlStrPath
 from exceptions import (
     InvalidFieldsError,
@@ -27,8 +28,18 @@ from schemas import (
     QueryParamType,
     WarehouseCreate,
 )
+from sqlalchemy import (  # type: ignore[attr-defined]
+    Select,
+    bindparam,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.exc import DatabaseError, IntegrityError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
     from pydantic.main import IncEx
@@ -41,67 +52,138 @@ LOGGER = getLogger(__name__)
 LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
 add_stream_handler(LOGGER)
 
+# Warehouse metadata is read on every item operation but rarely changes, so it is
+# cached in-process; the caches are invalidated wherever warehouses are mutated.
+_WAREHOUSE_CACHE: TTLCache[str, Warehouse] = TTLCache(maxsize=512, ttl=60)
+_SCHEMAS_CACHE: TTLCache[str, dict[str, ItemSchema]] = TTLCache(maxsize=2, ttl=30)
+_WAREHOUSE_PAGE_CACHE: TTLCache[tuple[int, int | None], WarehousePage] = TTLCache(
+    maxsize=32, ttl=30
+)
+
+
+# Pre-built so the statement is constructed once and always hits the compiled cache
+_SELECT_WAREHOUSE_BY_NAME = select(Warehouse).where(Warehouse.name == bindparam("name"))
+
+
+def _invalidate_warehouse_caches(warehouse_name: str, /) -> None:
+    """Remove a warehouse, and all schema and page lookups, from the caches."""
+    _WAREHOUSE_CACHE.pop(warehouse_name, None)
+    _SCHEMAS_CACHE.clear()
+    _WAREHOUSE_PAGE_CACHE.clear()
+
 
 # Warehouse Operations
 
 
-def create_warehouse(db: Session, /, warehouse: WarehouseCreate) -> Warehouse:
+async def create_warehouse(
+    db: AsyncSession, /, warehouse: WarehouseCreate
+) -> Warehouse:
     """Create a warehouse."""
     db_warehouse = Warehouse(**warehouse.model_dump(exclude_unset=True, by_alias=True))
 
     try:
-        db_warehouse.intialise_warehouse()
+        await db_warehouse.intialise_warehouse()
         db.add(db_warehouse)
-        db.commit()
-        db.refresh(db_warehouse)
+        await db.commit()
+        await db.refresh(db_warehouse)
     except DatabaseError:
-        db_warehouse.drop(no_exist_ok=True)
+        await db_warehouse.drop(no_exist_ok=True)
         raise
+    finally:
+        _invalidate_warehouse_caches(db_warehouse.name)
 
     return db_warehouse
 
 
-def delete_warehouse(db: Session, /, warehouse_name: SqlStrPath) -> None:
+async def delete_warehouse(db: AsyncSession, /, warehouse_name: SqlStrPath) -> None:
     """Delete a warehouse."""
-    warehouse = get_warehouse(db, warehouse_name)
+    warehouse = await get_warehouse(db, warehouse_name)
+
+    try:
+        await warehouse.drop(no_exist_ok=True)
 
-    warehouse.drop(no_exist_ok=True)
+        result = await db.execute(
+            delete(Warehouse).where(  # type: ignore[arg-type]
+                Warehouse.name == warehouse_name
+            )
+        )
 
-    if db.query(Warehouse).filter(Warehouse.name == warehouse_name).delete() == 0:
-        raise WarehouseNotFoundError(warehouse_name)
+        if result.rowcount == 0:
+            raise WarehouseNotFoundError(warehouse_name)
 
-    db.commit()
+        await db.commit()
+    finally:
+        _invalidate_warehouse_caches(warehouse_name)
 
 
 @overload
-def get_warehouse(
-    db: Session, /, name: SqlStrPath, *, no_exist_ok: Literal[False] = False
+async def get_warehouse(
+    db: AsyncSession, /, name: SqlStrPath, *, no_exist_ok: Literal[False] = False
 ) -> Warehouse: ...
 
 
 @overload
-def get_warehouse(
-    db: Session, /, name: SqlStrPath, *, no_exist_ok: Literal[True] = True
+async def get_warehouse(
+    db: AsyncSession, /, name: SqlStrPath, *, no_exist_ok: Literal[True] = True
 ) -> Warehouse | None: ...
 
 
-def get_warehouse(
-    db: Session, /, name: SqlStrPath, *, no_exist_ok: bool = False
+async def get_warehouse(
+    db: AsyncSession, /, name: SqlStrPath, *, no_exist_ok: bool = False
 ) -> Warehouse | None:
     """Get a warehouse by its name."""
 
+    if not no_exist_ok and (warehouse := _WAREHOUSE_CACHE.get(name)) is not None:
+        return warehouse
+
     if (
-        warehouse := db.query(Warehouse).filter(Warehouse.name == name).first()
+        warehouse := (
+            await db.execute(_SELECT_WAREHOUSE_BY_NAME, {"name": name})
+        ).scalar_one_or_none()
     ) is None:
         if no_exist_ok:
             return None
         raise WarehouseNotFoundError(name)
 
-    return warehouse
+    _WAREHOUSE_CACHE[name] = warehouse
+
+    return warehouse  # type: ignore[no-any-return]
+
+
+async def check_warehouse_collision(
+    db: AsyncSession, /, name: SqlStrPath, item_name: SqlStrPath
+) -> tuple[Warehouse | None, bool]:
+    """Check whether a new warehouse would collide with any existing warehouses.
+
+    Args:
+        db (AsyncSession): The database session to use.
+        name (str): The name of the new warehouse.
+        item_name (str): The name of the new warehouse's items.
+
+    Returns:
+        tuple[Warehouse | None, bool]: The existing warehouse with the same name (if
+            any), and whether the item name is already in use.
+    """
+
+    existing_warehouse = None
+    item_name_exists = False
+
+    for warehouse in await db.scalars(
+        select(Warehouse).where(
+            or_(Warehouse.name == name, Warehouse.item_name == item_name)
+        )
+    ):
+        if warehouse.name == name:
+            existing_warehouse = warehouse
+
+        if warehouse.item_name == item_name:
+            item_name_exists = True
 
+    return existing_warehouse, item_name_exists
 
-def get_warehouses(
-    db: Session,
+
+async def get_warehouses(
+    db: AsyncSession,
     /,
     *,
     offset: int = 0,
@@ -111,7 +193,7 @@ def get_warehouses(
     """Get a list of warehouses.
 
     Args:
-        db (Session): The database session to use.
+        db (AsyncSession): The database session to use.
         offset (int, optional): The offset to use when querying the database.
             Defaults to 0.
         limit (int, optional): The limit to use when querying the database.
@@ -123,14 +205,35 @@ def get_warehouses(
         list[Warehouse]: A list of warehouses.
     """
 
+    cache_key = (offset, limit)
+
+    if (page := _WAREHOUSE_PAGE_CACHE.get(cache_key)) is not None:
+        return page
+
     try:
-        query = db.query(Warehouse).offset(offset)
+        # The total is windowed into the page's rows to save a second round-trip
+        stmt = select(
+            Warehouse, func.count().over()  # pylint: disable=not-callable
+        ).offset(offset)
 
         if limit is not None:
-            query = query.limit(limit)
-
-        warehouses = query.all()
-        total = db.query(Warehouse).count()
+            stmt = stmt.limit(limit)
+
+        rows = (await db.execute(stmt)).all()
+
+        if rows:
+            total = rows[0][1]
+        elif offset == 0:
+            total = 0
+        else:
+            total = (
+                await db.scalar(
+                    select(func.count()).select_from(  # pylint: disable=not-callable
+                        Warehouse  # type: ignore[arg-type]
+                    )
+                )
+                or 0
+            )
     except DatabaseError as exc:
         if (
             allow_no_warehouse_table
@@ -140,9 +243,10 @@ def get_warehouses(
 
         raise
 
+    warehouses = [row[0] for row in rows]
     limit = limit or total
 
-    return WarehousePage(
+    page = _WAREHOUSE_PAGE_CACHE[cache_key] = WarehousePage(
         count=len(warehouses),
         warehouses=warehouses,
         max_page=total // limit,
@@ -150,9 +254,11 @@ def get_warehouses(
         total=total,
     )
 
+    return page
+
 
-def update_warehouse(
-    db: Session,
+async def update_warehouse(
+    db: AsyncSession,
     /,
     warehouse_name: SqlStrPath,
     warehouse: WarehouseCreate,
@@ -168,8 +274,8 @@ def update_warehouse(
 
 
 @overload
-def get_schema(
-    db: Session,
+async def get_schema(
+    db: AsyncSession,
     /,
     *,
     item_name: SqlStrPath | None = ...,
@@ -179,8 +285,8 @@ def get_schema(
 
 
 @overload
-def get_schema(
-    db: Session,
+async def get_schema(
+    db: AsyncSession,
     /,
     *,
     item_name: SqlStrPath | None = ...,
@@ -189,8 +295,8 @@ def get_schema(
 ) -> ItemSchema | None: ...
 
 
-def get_schema(
-    db: Session,
+async def get_schema(
+    db: AsyncSession,
     /,
     *,
     item_name: SqlStrPath | None = None,
@@ -205,15 +311,31 @@ def get_schema(
             detail="Either item_name or warehouse_name must be provided.",
         )
 
-    query = db.query(Warehouse.item_schema)
+    # Single-name lookups can be served from the cached schema mappings
+    if item_name is None or warehouse_name is None:
+        schemas = (
+            await get_item_schemas(db)
+            if warehouse_name is None
+            else await get_warehouse_schemas(db)
+        )
+
+        if (item_schema := schemas.get(item_name or warehouse_name)) is not None:  # type: ignore[arg-type]
+            return item_schema
+
+        if no_exist_ok:
+            return None
+
+        raise ItemSchemaNotFoundError(warehouse_name)
+
+    stmt = select(Warehouse.item_schema)  # type: ignore[arg-type]
 
     if item_name is not None:
-        query = query.filter(Warehouse.item_name == item_name)
+        stmt = stmt.where(Warehouse.item_name == item_name)
 
     if warehouse_name is not None:
-        query = query.filter(Warehouse.name == warehouse_name)
+        stmt = stmt.where(Warehouse.name == warehouse_name)
 
-    if not (results := query.all()):
+    if not (results := (await db.execute(stmt)).all()):
         if no_exist_ok:
             return None
 
@@ -222,21 +344,39 @@ def get_schema(
     if len(results) > 1:
         raise TooManyResultsError(len(results))
 
-    return results[0][0]
+    return results[0][0]  # type: ignore[no-any-return]
 
 
-def get_item_schemas(db: Session, /) -> dict[str, ItemSchema]:
+async def get_item_schemas(db: AsyncSession, /) -> dict[str, ItemSchema]:
     """Get a list of items and their schemas."""
-    return dict(db.query(Warehouse.item_name, Warehouse.item_schema))
+    if (item_schemas := _SCHEMAS_CACHE.get("item")) is None:
+        item_schemas = _SCHEMAS_CACHE["item"] = dict(
+            (
+                await db.execute(
+                    select(Warehouse.item_name, Warehouse.item_schema)  # type: ignore[arg-type]
+                )
+            ).all()
+        )
 
+    return item_schemas
 
-def get_warehouse_schemas(db: Session, /) -> dict[str, ItemSchema]:
+
+async def get_warehouse_schemas(db: AsyncSession, /) -> dict[str, ItemSchema]:
     """Get a list of warehouses and their schemas."""
-    return dict(db.query(Warehouse.name, Warehouse.item_schema))
+    if (warehouse_schemas := _SCHEMAS_CACHE.get("warehouse")) is None:
+        warehouse_schemas = _SCHEMAS_CACHE["warehouse"] = dict(
+            (
+                await db.execute(
+                    select(Warehouse.name, Warehouse.item_schema)  # type: ignore[arg-type]
+                )
+            ).all()
+        )
 
+    return warehouse_schemas
 
-def update_schema(
-    db: Session,
+
+async def update_schema(
+    db: AsyncSession,
     /,
     *,
     schema: dict[Literal["display_as"], DisplayType],
@@ -245,91 +385,187 @@ def update_schema(
 ) -> ItemSchema:
     """Update an ItemSchema."""
 
-    warehouse = get_warehouse(db, warehouse_name)
+    warehouse = await get_warehouse(db, warehouse_name)
 
     if field_name not in warehouse.item_schema:
         raise InvalidFieldsError(field_name)
 
     if (display_as := schema["display_as"]) == DisplayType.RESET:
-        warehouse.item_schema[field_name]["display_as"] = DisplayType.from_type_name(  # type: ignore[index]
+        display_as = DisplayType.from_type_name(
             warehouse.item_schema[field_name]["type"]  # type: ignore[index]
         )
-    else:
-        warehouse.item_schema[field_name]["display_as"] = display_as  # type: ignore[index]
 
-    db.query(Warehouse).filter(Warehouse.name == warehouse_name).update(
-        warehouse.as_dict()
-    )
+    try:
+        # Only the one key is patched server-side, rather than rewriting the whole row
+        await db.execute(
+            update(Warehouse)  # type: ignore[arg-type]
+            .where(Warehouse.name == warehouse_name)
+            .values(
+                item_schema=func.json_set(
+                    Warehouse.item_schema,
+                    f'$."{field_name}".display_as',
+                    display_as.value,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-    db.commit()
-    return get_schema(db, warehouse_name=warehouse_name)
+        await db.commit()
+    finally:
+        _invalidate_warehouse_caches(warehouse_name)
+
+    return warehouse.item_schema | {
+        field_name: warehouse.item_schema[field_name]  # type: ignore[operator]
+        | {"display_as": display_as}
+    }
 
 
 # Item Operations
 
 
-def create_item(
-    db: Session, warehouse_name: SqlStrPath, item: GeneralItemModelType
+async def create_item(
+    db: AsyncSession, warehouse_name: SqlStrPath, item: GeneralItemModelType
 ) -> ItemResponse:
     """Create an item in a warehouse."""
 
-    warehouse = get_warehouse(db, warehouse_name)
+    return (await create_items(db, warehouse_name, [item]))[0]
 
-    pk_values = {}
-    for pk_name in warehouse.pk_name:
-        if pk_name not in item and warehouse.item_schema[pk_name].get(  # type: ignore[attr-defined]
-            "autoincrement"
-        ) in (
-            True,
-            "auto",
-        ):
-            # Autoincrementing PK removes the need to validate the item
-            break
-        pk_values[pk_name] = item[pk_name]
-    else:
-        if get_item_by_pk(db, warehouse_name, pk_values=pk_values, no_exist_ok=True):
-            raise ItemExistsError(pk_values, warehouse_name)
 
-    LOGGER.debug("Validating item into schema: %r ", item)
+async def _check_items_dont_exist(
+    db: AsyncSession, warehouse: Warehouse, items: list[GeneralItemModelType]
+) -> None:
+    """Check that no two items share a PK, and that none of them already exist."""
+
+    # Keyed on the parsed PK so that the client's own values can be reported back
+    batch_pks: dict[tuple[Any, ...], dict[str, Any]] = {}
+    pk_conditions = []
+    for item in items:
+        pk_values = {}
+        for pk_name in warehouse.pk_name:
+            if pk_name not in item and warehouse.item_schema[pk_name].get(  # type: ignore[attr-defined]
+                "autoincrement"
+            ) in (
+                True,
+                "auto",
+            ):
+                # Autoincrementing PK removes the need to validate the item
+                break
+            pk_values[pk_name] = item[pk_name]
+        else:
+            if (item_pk := warehouse.parse_pk_dict(pk_values)) in batch_pks:
+                raise ItemExistsError(pk_values, warehouse.name)
+
+            batch_pks[item_pk] = pk_values
+            pk_conditions.append(warehouse.get_pk_filter_condition(pk_values))
+
+    if pk_conditions and (
+        existing_pk := (
+            await db.execute(
+                select(*warehouse.pk)  # type: ignore[arg-type]
+                .where(or_(*pk_conditions))
+                .limit(1)
+            )
+        ).first()
+    ):
+        raise ItemExistsError(
+            batch_pks.get(
+                tuple(existing_pk), dict(zip(warehouse.pk_name, existing_pk))
+            ),
+            warehouse.name,
+        )
+
+
+async def create_items(
+    db: AsyncSession, warehouse_name: SqlStrPath, items: list[GeneralItemModelType]
+) -> list[ItemResponse]:
+    """Create a batch of items in a warehouse in a single transaction."""
+
+    if not items:
+        return []
+
+    warehouse = await get_warehouse(db, warehouse_name)
+
+    await _check_items_dont_exist(db, warehouse, items)
+
+    # Checked once up front, to skip formatting (potentially large) items needlessly
+    debug_enabled = LOGGER.isEnabledFor(DEBUG)
+
+    rows = []
+    for item in items:
+        if debug_enabled:
+            LOGGER.debug("Validating item into schema: %r ", item)
+
+        item_schema: ItemBase = warehouse.item_schema_class.model_validate(item)
+
+        # Excluding unset values mean any default functions don't get returned as-is.
+        rows.append(item_schema.model_dump(exclude_unset=True))
 
-    item_schema: ItemBase = warehouse.item_schema_class.model_validate(item)
+    if not db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        # No (ordered) INSERT ... RETURNING support, e.g. MySQL or MariaDB < 10.5, so
+        # the new items have to be re-read after they've been inserted.
+        db_items = [warehouse.item_model(**row) for row in rows]
 
-    LOGGER.debug("Dumping item into model: %r", item_schema)
+        db.add_all(db_items)
+        await db.commit()
 
-    # Excluding unset values mean any default functions don't get returned as-is.
-    db_item = warehouse.item_model(**item_schema.model_dump(exclude_unset=True))
+        item_responses: list[ItemResponse] = []
+        for db_item in db_items:
+            await db.refresh(db_item)
 
-    db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
+            # Re-parse so that we've got any new/updated values from the database.
+            item_responses.append(
+                cast(
+                    ItemResponse,
+                    warehouse.item_schema_class.model_validate(db_item.as_dict()),
+                )
+            )
+
+        return item_responses
+
+    # One round-trip per set of populated fields, rather than one per item
+    db_rows = (
+        await db.execute(
+            insert(warehouse.item_model).returning(  # type: ignore[call-arg]
+                *warehouse.item_model.__table__.columns, sort_by_parameter_order=True
+            ),
+            rows,
+        )
+    ).mappings()
 
-    # Re-parse so that we've got any new/updated values from the database.
-    return warehouse.item_schema_class.model_validate(
-        db_item.as_dict()
-    )  # type: ignore[return-value]
+    item_responses = [
+        # The returned rows already hold the database's (typed) values, so there's no
+        # need to validate them a second time.
+        cast(ItemResponse, warehouse.item_schema_class.model_construct(**db_row))
+        for db_row in db_rows
+    ]
 
+    await db.commit()
 
-def delete_item(
-    db: Session, /, warehouse_name: SqlStrPath, search_values: QueryParamType
+    return item_responses
+
+
+async def delete_item(
+    db: AsyncSession, /, warehouse_name: SqlStrPath, search_values: QueryParamType
 ) -> None:
     """Delete an item from a warehouse."""
 
-    warehouse = get_warehouse(db, warehouse_name)
+    warehouse = await get_warehouse(db, warehouse_name)
 
-    if (
-        db.query(warehouse.item_model)
-        .filter(warehouse.get_pk_filter_condition(search_values))
-        .delete()
-        == 0
-    ):
+    result = await db.execute(
+        delete(warehouse.item_model).where(
+            warehouse.get_pk_filter_condition(search_values)
+        )
+    )
+
+    if result.rowcount == 0:
         raise ItemNotFoundError(search_values)
 
-    db.commit()
+    await db.commit()
 
 
 @overload
-def get_item_by_pk(
-    db: Session,
+async def get_item_by_pk(
+    db: AsyncSession,
     /,
     warehouse_name: SqlStrPath,
     pk_values: GeneralItemModelType | QueryParamType,
@@ -340,8 +576,8 @@ def get_item_by_pk(
 
 
 @overload
-def get_item_by_pk(
-    db: Session,
+async def get_item_by_pk(
+    db: AsyncSession,
     /,
     warehouse_name: SqlStrPath,
     pk_values: GeneralItemModelType | QueryParamType,
@@ -351,8 +587,8 @@ def get_item_by_pk(
 ) -> GeneralItemModelType | None: ...
 
 
-def get_item_by_pk(
-    db: Session,
+async def get_item_by_pk(
+    db: AsyncSession,
     /,
     warehouse_name: SqlStrPath,
     pk_values: GeneralItemModelType | QueryParamType,
@@ -363,7 +599,7 @@ def get_item_by_pk(
     """Get an item from a warehouse.
 
     Args:
-        db (Session): The database session to use.
+        db (AsyncSession): The database session to use.
         warehouse_name (str): The name of the warehouse to get the item from.
         pk_values (dict[str, str]): The primary key values of the item to get.
         field_names (list[str], optional): The names of the fields to return. Defaults
@@ -375,30 +611,50 @@ def get_item_by_pk(
         ItemResponse | None: The item, or None if it doesn't exist.
     """
 
-    warehouse = get_warehouse(db, warehouse_name)
+    warehouse = await get_warehouse(db, warehouse_name)
 
     if field_names and (
         unknown_fields := [
             field_name
             for field_name in field_names
-            if field_name not in warehouse.item_model.__table__.columns
+            if field_name not in warehouse.item_field_names
         ]
     ):
         raise InvalidFieldsError(unknown_fields)
 
     item_pk = warehouse.parse_pk_dict(pk_values)
 
-    if (item := db.query(warehouse.item_model).get(item_pk)) is None:
-        if no_exist_ok:
-            return None
+    if field_names:
+        # Only select the requested columns, rather than loading the whole item
+        field_names = list(dict.fromkeys(field_names))
+
+        stmt = select(
+            *(getattr(warehouse.item_model, field_name) for field_name in field_names)
+        ).where(warehouse.get_pk_filter_condition(pk_values))
+
+        if (row := (await db.execute(stmt)).first()) is not None:
+            # pylint: disable-next=protected-access
+            serialize = warehouse.item_model._serialize
+
+            return {
+                field_name: serialize(value)
+                for field_name, value in zip(field_names, row, strict=True)
+            }
+    elif (
+        item := await db.get(  # type: ignore[func-returns-value]
+            warehouse.item_model, item_pk
+        )
+    ) is not None:
+        return item.as_dict()
 
-        raise ItemNotFoundError(item_pk, warehouse_name)
+    if no_exist_ok:
+        return None
 
-    return item.as_dict(include=field_names)
+    raise ItemNotFoundError(item_pk, warehouse_name)
 
 
-def get_items(
-    db: Session,
+async def get_items(
+    db: AsyncSession,
     /,
     warehouse_name: SqlStrPath,
     field_names: list[str] | None = None,
@@ -414,7 +670,7 @@ def get_items(
     """Get a list of items in a warehouse.
 
     Args:
-        db (Session): The database session to use.
+        db (AsyncSession): The database session to use.
         warehouse_name (str): The name of the warehouse to get the items from.
         field_names (list[str], optional): The names of the fields to return. Defaults
             to None.
@@ -437,19 +693,22 @@ def get_items(
         _HTTPException: Raised if an invalid field name is provided.
     """
 
-    warehouse = get_warehouse(db, warehouse_name)
+    warehouse = await get_warehouse(db, warehouse_name)
 
     if warehouse.search_params_are_pks(search_params):
         LOGGER.debug("Searching for item by primary key.")
-        return get_item_by_pk(
+        return await get_item_by_pk(
             db,
             warehouse_name=warehouse_name,
             field_names=field_names,
             pk_values=search_params,
         )
 
+    columns: tuple[Any, ...]
+
     if not field_names:
-        query: Query[Warehouse] = db.query(warehouse.item_model)
+        # Plain columns rather than ORM entities, so no instances are built per row
+        columns = tuple(warehouse.item_model.__table__.columns)
     else:
         if order_by:
             field_names.append(order_by)
@@ -457,19 +716,26 @@ def get_items(
         # Always include PK for uniqueness
         field_names.extend(warehouse.pk_name)
 
-        field_names = sorted(set(field_names))
+        # De-duplicate, keeping the requested order
+        field_names = list(dict.fromkeys(field_names))
 
         try:
-            fields = tuple(
+            columns = tuple(
                 getattr(warehouse.item_model, field_name) for field_name in field_names
             )
         except AttributeError as exc:
             raise InvalidFieldsError(exc.name) from exc
 
-        query = db.query(*fields)
+    column_names = [column.key for column in columns]
 
-    for k, v in search_params.items():
-        query = query.filter(getattr(warehouse.item_model, k) == v)
+    conditions = [
+        getattr(warehouse.item_model, k) == v for k, v in search_params.items()
+    ]
+
+    # The total is windowed into the page's rows to save a second round-trip
+    stmt: Select[Any] = select(  # type: ignore[call-arg]
+        *columns, func.count().over()  # pylint: disable=not-callable
+    ).where(*conditions)
 
     if order_by:
         try:
@@ -477,21 +743,29 @@ def get_items(
         except AttributeError as exc:
             raise InvalidFieldsError(exc.name) from exc
 
-        query = query.order_by(
-            ordered_field.asc() if ascending else ordered_field.desc()
+        stmt = stmt.order_by(ordered_field.asc() if ascending else ordered_field.desc())
+
+    items: list[GeneralItemModelType] = []
+    total: int | None = None
+
+    # A page is at most 100 rows, so it's cheaper to fetch it in one go than to stream it
+    for row in await db.execute(stmt.offset(offset).limit(limit)):
+        *values, total = row
+        items.append(dict(zip(column_names, values, strict=True)))
+
+    if total is None:
+        # No rows at this offset, so the windowed total isn't available
+        total = (
+            0
+            if offset == 0
+            else await db.scalar(
+                select(func.count())  # pylint: disable=not-callable
+                .select_from(warehouse.item_model)
+                .where(*conditions)
+            )
+            or 0
         )
 
-    results = query.offset(offset).limit(limit).all()
-
-    if field_names:
-        items: list[GeneralItemModelType] = [
-            dict(zip(field_names, row, strict=True)) for row in results
-        ]
-    else:
-        items = [row.as_dict() for row in results]
-
-    total = get_item_count(db, warehouse_name)
-
     return ItemPage(
         count=len(items),
         items=items,
@@ -502,8 +776,8 @@ def get_items(
     )
 
 
-def update_item(
-    db: Session,
+async def update_item(
+    db: AsyncSession,
     /,
     *,
     warehouse_name: SqlStrPath,
@@ -512,36 +786,51 @@ def update_item(
 ) -> GeneralItemModelType:
     """Update an item in a warehouse."""
 
-    warehouse = get_warehouse(db, warehouse_name)
+    warehouse = await get_warehouse(db, warehouse_name)
+
+    item_pk = warehouse.parse_pk_dict(pk_values)
 
-    current_item_dict = get_item_by_pk(db, warehouse_name, pk_values=pk_values)
+    if (
+        db_item := await db.get(  # type: ignore[func-returns-value]
+            warehouse.item_model, item_pk
+        )
+    ) is None:
+        raise ItemNotFoundError(item_pk, warehouse_name)
 
-    new_item_dict = current_item_dict | item_update
+    new_item_dict = db_item.as_dict() | item_update
 
-    LOGGER.debug(
-        "Parsed item update into new item: %s",
-        dumps(new_item_dict, indent=2, sort_keys=True),
-    )
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug(
+            "Parsed item update into new item: %s",
+            dumps(new_item_dict, indent=2, sort_keys=True),
+        )
 
     warehouse.item_schema_class.model_validate(new_item_dict)
 
     try:
-        db.query(warehouse.item_model).filter(
-            warehouse.get_pk_filter_condition(pk_values)
-        ).update(item_update)
+        await db.execute(
+            update(warehouse.item_model)
+            .where(warehouse.get_pk_filter_condition(pk_values))
+            .values(item_update)
+        )
     except IntegrityError as exc:
         if "unique constraint failed" in str(exc).lower():
             raise ItemExistsError(pk_values, warehouse_name) from exc
         raise
 
-    db.commit()
-    return get_item_by_pk(db, warehouse_name, pk_values=pk_values)
-
+    await db.commit()
 
-# TODO caching!
-def get_item_count(db: Session, /, warehouse_name: SqlStrPath) -> int:
-    """Get the number of items in a warehouse."""
+    # The update may have changed the PK, so the item is re-read by its new PK. The
+    # session doesn't expire objects on commit either, hence `populate_existing`.
+    new_item_pk = warehouse.parse_pk_dict(
+        {pk_name: new_item_dict[pk_name] for pk_name in warehouse.pk_name}
+    )
 
-    warehouse = get_warehouse(db, warehouse_name)
+    if (
+        db_item := await db.get(
+            warehouse.item_model, new_item_pk, populate_existing=True
+        )
+    ) is None:
+        raise ItemNotFoundError(new_item_pk, warehouse_name)
 
-    return db.query(warehouse.item_model).count()
+    return db_item.as_dict()
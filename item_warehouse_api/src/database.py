@@ -8,12 +8,14 @@ from logging import getLogger
 from os import getenv
 from typing import Annotated, Any, ClassVar, Literal, overload
 
+import orjson
 from _helpers import add_stream_handler
 from fastapi.params import Path
 from schemas import ITEM_TYPE_TYPES, DefaultFunction, GeneralItemModelType
 from sqlalchemy import Table
-from sqlalchemy.engine import Engine, create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker  # type: ignore[attr-defined]
+from sqlalchemy.engine import make_url  # type: ignore[attr-defined]
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base  # type: ignore[attr-defined]
 
 LOGGER = getLogger(__name__)
 LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
@@ -87,13 +89,32 @@ else:
             f"Missing environment variable: {exc!s}"
         ) from exc
 
+# Sync drivers (e.g. from existing add-on configs) are swapped for their async
+# equivalents so that the engine can be used with `AsyncSession`s.
+_ASYNC_DRIVERS = {
+    "mariadb": "aiomysql",
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+}
+
+_url = make_url(SQLALCHEMY_DATABASE_URL)
+if (_async_driver := _ASYNC_DRIVERS.get(_url.get_backend_name())) and (
+    _url.get_driver_name() != _async_driver
+):
+    LOGGER.info(
+        "Using async driver %r instead of %r.", _async_driver, _url.get_driver_name()
+    )
+    SQLALCHEMY_DATABASE_URL = _url.set(
+        drivername=f"{_url.get_backend_name()}+{_async_driver}"
+    ).render_as_string(hide_password=False)
+
 
 class _BaseExtra:
     """Extra functionality for SQLAlchemy models."""
 
     __table__: Table
 
-    ENGINE: ClassVar[Engine]
+    ENGINE: ClassVar[AsyncEngine]
 
     def __init__(self, *_: Any, **__: Any) -> None:
         raise NotImplementedError(
@@ -102,15 +123,28 @@ class _BaseExtra:
         )
 
     @classmethod
-    def _custom_json_serializer(cls, *args: Any, **kwargs: Any) -> str:
-        return dumps(*args, default=cls._serialize, **kwargs)
+    def _custom_json_serializer(cls, obj: Any) -> str:
+        return orjson.dumps(obj, default=cls._orjson_default).decode()
+
+    @staticmethod
+    def _orjson_default(obj: Any) -> Any:
+        """Serialize the types that orjson doesn't support natively."""
+        if isinstance(obj, DefaultFunction):
+            return obj.ref
+
+        if isinstance(obj, type) and obj in ITEM_TYPE_TYPES:
+            return obj.__name__.lower()
+
+        raise TypeError(  # noqa: TRY003
+            f"Type is not JSON serializable: {type(obj).__name__}"
+        )
 
     @classmethod
     def _serialize(cls, obj: Any) -> Any:
         if isinstance(obj, DefaultFunction):
             return obj.ref
 
-        if obj in ITEM_TYPE_TYPES:
+        if isinstance(obj, type) and obj in ITEM_TYPE_TYPES:
             return obj.__name__.lower()
 
         if isinstance(obj, (date | datetime)):
@@ -168,20 +202,33 @@ class _BaseExtra:
         return fields
 
 
-_BaseExtra.ENGINE = create_engine(
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    _ENGINE_KWARGS: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+else:
+    # Reuse connections across requests, and check/recycle them before MariaDB's
+    # `wait_timeout` closes them from the server side.
+    _ENGINE_KWARGS = {
+        "pool_size": int(_getenv("DATABASE_POOL_SIZE", "20")),
+        "max_overflow": int(_getenv("DATABASE_MAX_OVERFLOW", "10")),
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+_BaseExtra.ENGINE = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     json_serializer=_BaseExtra._custom_json_serializer,  # pylint: disable=protected-access
-    connect_args=(
-        {"check_same_thread": False}
-        if SQLALCHEMY_DATABASE_URL.startswith("sqlite")
-        else {}
-    ),
+    json_deserializer=orjson.loads,
+    query_cache_size=1200,
+    **_ENGINE_KWARGS,
 )
 
 Base = declarative_base(cls=_BaseExtra)
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_BaseExtra.ENGINE)
+SessionLocal = async_sessionmaker(
+    _BaseExtra.ENGINE, autoflush=False, expire_on_commit=False
+)
 
 SqlStrPath = Annotated[
     str, Path(pattern=r"^[a-zA-Z0-9_]+$", min_length=1, max_length=64)
@@ -6,7 +6,7 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from enum import StrEnum, auto
 from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import getenv
 from traceback import format_exception
 from typing import Annotated, Any, Literal
@@ -35,18 +35,12 @@ from schemas import (
     WarehouseCreate,
 )
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 LOGGER = getLogger(__name__)
 LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
 add_stream_handler(LOGGER)
 
-try:
-    Base.metadata.create_all(bind=WarehouseModel.ENGINE)
-except OperationalError:
-    LOGGER.debug(SQLALCHEMY_DATABASE_URL)
-    raise
-
 
 class ApiTag(StrEnum):
     """API tags."""
@@ -59,20 +53,25 @@ class ApiTag(StrEnum):
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
-    """Populate the item model/schema lookups before the application lifecycle starts."""
-
-    db = SessionLocal()
+    """Create the tables and populate the item model/schema lookups on startup."""
 
     try:
-        for warehouse in crud.get_warehouses(
-            db,
-            allow_no_warehouse_table=True,
+        async with WarehouseModel.ENGINE.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    except OperationalError:
+        LOGGER.debug(SQLALCHEMY_DATABASE_URL)
+        raise
+
+    async with SessionLocal() as db:
+        for warehouse in (
+            await crud.get_warehouses(
+                db,
+                allow_no_warehouse_table=True,
+            )
         ).warehouses:
             # Just accessing the item_model property will create the SQLAlchemy model.
             __ = warehouse.item_model
             ___ = warehouse.item_schema_class
-    finally:
-        db.close()
 
     LOGGER.debug(
         "Warehouse._ITEM_SCHEMAS: %r",
@@ -202,20 +201,22 @@ def fallback_error_handler(_: Request, exc: Exception) -> JSONResponse:
     tags=[ApiTag.WAREHOUSE],
     response_model_exclude_unset=True,
 )
-def create_warehouse(
-    warehouse: WarehouseCreate, db: Session = Depends(get_db)  # noqa: B008
+async def create_warehouse(
+    warehouse: WarehouseCreate, db: AsyncSession = Depends(get_db)  # noqa: B008
 ) -> WarehouseModel:
     """Create a warehouse."""
 
-    if (
-        db_warehouse := crud.get_warehouse(db, warehouse.name, no_exist_ok=True)
-    ) is not None:
-        raise WarehouseExistsError(db_warehouse)
+    existing_warehouse, item_name_exists = await crud.check_warehouse_collision(
+        db, warehouse.name, warehouse.item_name
+    )
+
+    if existing_warehouse is not None:
+        raise WarehouseExistsError(existing_warehouse)
 
-    if crud.get_schema(db, item_name=warehouse.item_name, no_exist_ok=True) is not None:
+    if item_name_exists:
         raise ItemSchemaExistsError(warehouse.item_name)
 
-    return crud.create_warehouse(db, warehouse)
+    return await crud.create_warehouse(db, warehouse)
 
 
 @app.delete(
@@ -223,11 +224,11 @@ def create_warehouse(
     response_model=Any,
     tags=[ApiTag.WAREHOUSE],
 )
-def delete_warehouse(
-    warehouse_name: SqlStrPath, db: Session = Depends(get_db)  # noqa: B008
+async def delete_warehouse(
+    warehouse_name: SqlStrPath, db: AsyncSession = Depends(get_db)  # noqa: B008
 ) -> Any:
     """Delete a warehouse."""
-    crud.delete_warehouse(db, warehouse_name)
+    await crud.delete_warehouse(db, warehouse_name)
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -238,12 +239,12 @@ def delete_warehouse(
     tags=[ApiTag.WAREHOUSE],
     response_model_exclude_unset=True,
 )
-def get_warehouse(
-    warehouse_name: SqlStrPath, db: Session = Depends(get_db)  # noqa: B008
+async def get_warehouse(
+    warehouse_name: SqlStrPath, db: AsyncSession = Depends(get_db)  # noqa: B008
 ) -> WarehouseModel:
     """Get a warehouse."""
 
-    return crud.get_warehouse(db, warehouse_name)
+    return await crud.get_warehouse(db, warehouse_name)
 
 
 @app.get(
@@ -252,24 +253,24 @@ def get_warehouse(
     tags=[ApiTag.PAGINATED, ApiTag.WAREHOUSE],
     response_model_exclude_unset=True,
 )
-def get_warehouses(
+async def get_warehouses(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(gt=0, le=100)] = 100,
-    db: Session = Depends(get_db),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> WarehousePage:
     """List warehouses."""
 
-    return crud.get_warehouses(db, offset=(page - 1) * page_size, limit=page_size)
+    return await crud.get_warehouses(db, offset=(page - 1) * page_size, limit=page_size)
 
 
 @app.put("/v1/warehouses/{warehouse_name}", tags=[ApiTag.WAREHOUSE])
-def update_warehouse(
+async def update_warehouse(
     warehouse_name: SqlStrPath,
     warehouse: WarehouseCreate,
-    db: Session = Depends(get_db),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> Any:
     """Update a warehouse in a warehouse."""
-    return crud.update_warehouse(db, warehouse_name, warehouse)
+    return await crud.update_warehouse(db, warehouse_name, warehouse)
 
 
 # Warehouse Schema Endpoints
@@ -283,11 +284,11 @@ def update_warehouse(
     tags=[ApiTag.ITEM_SCHEMA],
     response_model_exclude_unset=True,
 )
-def get_item_schema(
-    warehouse_name: SqlStrPath, db: Session = Depends(get_db)  # noqa: B008
+async def get_item_schema(
+    warehouse_name: SqlStrPath, db: AsyncSession = Depends(get_db)  # noqa: B008
 ) -> ItemSchema:
     """Get an warehouse's/item's schema."""
-    return crud.get_schema(db, warehouse_name=warehouse_name)
+    return await crud.get_schema(db, warehouse_name=warehouse_name)
 
 
 @app.put(
@@ -296,9 +297,9 @@ def get_item_schema(
     tags=[ApiTag.ITEM_SCHEMA],
     response_model_exclude_unset=True,
 )
-def update_item_field_definition(
+async def update_item_field_definition(
     *,
-    db: Session = Depends(get_db),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
     warehouse_name: SqlStrPath,
     field_name: SqlStrPath,
     update: Annotated[
@@ -316,7 +317,7 @@ def update_item_field_definition(
     ],
 ) -> ItemSchema:
     """Update an item's field definition."""
-    return crud.update_schema(
+    return await crud.update_schema(
         db, schema=update, field_name=field_name, warehouse_name=warehouse_name
     )
 
@@ -327,11 +328,11 @@ def update_item_field_definition(
     tags=[ApiTag.ITEM_SCHEMA],
     response_model_exclude_unset=True,
 )
-def get_item_schemas(
-    db: Session = Depends(get_db),  # noqa: B008
+async def get_item_schemas(
+    db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> dict[str, ItemSchema]:
     """Get a list of items' names and schemas."""
-    return crud.get_item_schemas(db)
+    return await crud.get_item_schemas(db)
 
 
 # Item Endpoints
@@ -342,7 +343,7 @@ def get_item_schemas(
     response_model=Any,
     tags=[ApiTag.ITEM],
 )
-def create_item(
+async def create_item(
     warehouse_name: SqlStrPath,
     item: Annotated[
         GeneralItemModelType,
@@ -360,17 +361,70 @@ def create_item(
         ),
     ],
     request: Request,
-    db: Session = Depends(get_db),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> ItemResponse:
     """Create an item."""
 
     LOGGER.info("POST\t/v1/warehouses/%s/items", warehouse_name)
-    LOGGER.debug(dumps(item))
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug(dumps(item))
 
     if client := request.client:
         item.update({"_request.client.host": client.host})
 
-    res = crud.create_item(db, warehouse_name, item)
+    res = await crud.create_item(db, warehouse_name, item)
+
+    LOGGER.info("RESPONSE: %r", res)
+
+    return res
+
+
+@app.post(
+    "/v1/warehouses/{warehouse_name}/items/bulk",
+    response_model=Any,
+    tags=[ApiTag.ITEM],
+)
+async def create_items(
+    warehouse_name: SqlStrPath,
+    items: Annotated[
+        list[GeneralItemModelType],
+        Body(
+            examples=[
+                [
+                    {
+                        "name": "Joe Bloggs",
+                        "age": 42,
+                        "salary": 123456,
+                        "alive": True,
+                        "hire_date": "2021-01-01",
+                        "last_login": "2021-01-01T12:34:56",
+                    },
+                    {
+                        "name": "Jane Doe",
+                        "age": 37,
+                        "salary": 654321,
+                        "alive": True,
+                        "hire_date": "2021-02-01",
+                        "last_login": "2021-02-01T12:34:56",
+                    },
+                ]
+            ]
+        ),
+    ],
+    request: Request,
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+) -> list[ItemResponse]:
+    """Create multiple items in a single transaction."""
+
+    LOGGER.info("POST\t/v1/warehouses/%s/items/bulk", warehouse_name)
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug(dumps(items))
+
+    if client := request.client:
+        for item in items:
+            item.update({"_request.client.host": client.host})
+
+    res = await crud.create_items(db, warehouse_name, items)
 
     LOGGER.info("RESPONSE: %r", res)
 
@@ -382,14 +436,14 @@ def create_item(
     response_model=Any,
     tags=[ApiTag.ITEM],
 )
-def delete_item(
+async def delete_item(
     request: Request,
     warehouse_name: SqlStrPath,
-    db: Session = Depends(get_db),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> Any:
     """Delete an item in a warehouse."""
 
-    crud.delete_item(db, warehouse_name, search_values=dict(request.query_params))
+    await crud.delete_item(db, warehouse_name, search_values=dict(request.query_params))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -399,7 +453,7 @@ def delete_item(
     response_model=ItemPage | ItemResponse,
     tags=[ApiTag.ITEM, ApiTag.PAGINATED],
 )
-def get_items(
+async def get_items(
     *,
     request: Request,
     warehouse_name: SqlStrPath,
@@ -441,7 +495,7 @@ def get_items(
             description="Sort ascending if true, descending if false.",
         ),
     ] = True,
-    db: Session = Depends(get_db),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> ItemPage | GeneralItemModelType:
     """Get items in a warehouse."""
 
@@ -459,7 +513,7 @@ def get_items(
         )
     }
 
-    return crud.get_items(
+    return await crud.get_items(
         db,
         warehouse_name,
         offset=(page - 1) * page_size,
@@ -477,7 +531,7 @@ def get_items(
     response_model=ItemResponse,
     tags=[ApiTag.ITEM],
 )
-def update_item(
+async def update_item(
     request: Request,
     warehouse_name: SqlStrPath,
     item: Annotated[
@@ -492,11 +546,11 @@ def update_item(
             ]
         ),
     ],
-    db: Session = Depends(get_db),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> GeneralItemModelType:
     """Update an item in a warehouse."""
 
-    return crud.update_item(
+    return await crud.update_item(
         db,
         warehouse_name=warehouse_name,
         pk_values=dict(request.query_params),
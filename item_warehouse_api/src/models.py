@@ -53,6 +53,8 @@ class Warehouse(Base):  # type: ignore[misc]
     _ITEM_MODELS: ClassVar[dict[str, DeclarativeMeta]] = {}
     _ITEM_SCHEMAS: ClassVar[dict[str, ItemBase]] = {}
     _ITEM_UPDATE_SCHEMAS: ClassVar[dict[str, ItemUpdateBase]] = {}
+    _ITEM_FIELD_NAMES: ClassVar[dict[str, frozenset[str]]] = {}
+    _ITEM_PKS: ClassVar[dict[str, tuple[InstrumentedAttribute, ...]]] = {}
 
     name: Column[str] = Column(
         name="name", type_=String(length=255), primary_key=True, unique=True, index=True
@@ -94,13 +96,14 @@ class Warehouse(Base):  # type: ignore[misc]
         """
         return sorted(self.pk_name) == sorted(search_params.keys())
 
-    def drop(self, *, no_exist_ok: bool = False) -> None:
+    async def drop(self, *, no_exist_ok: bool = False) -> None:
         """Drop the physical table for storing items in."""
 
         LOGGER.info("Dropping warehouse %r", self.name)
 
         try:
-            self.item_model.__table__.drop(bind=self.ENGINE)
+            async with self.ENGINE.begin() as conn:
+                await conn.run_sync(self.item_model.__table__.drop)
         except OperationalError as exc:
             if "unknown table" in str(exc).lower():
                 if not no_exist_ok:
@@ -116,13 +119,16 @@ class Warehouse(Base):  # type: ignore[misc]
 
             self._ITEM_MODELS.pop(self.name, None)
             self._ITEM_SCHEMAS.pop(self.name, None)
+            self._ITEM_FIELD_NAMES.pop(self.name, None)
+            self._ITEM_PKS.pop(self.name, None)
 
-    def intialise_warehouse(self) -> None:
+    async def intialise_warehouse(self) -> None:
         """Create a new physical table for storing items in."""
 
         LOGGER.info("Creating warehouse %r", self.name)
 
-        self.item_model.__table__.create(bind=self.ENGINE)
+        async with self.ENGINE.begin() as conn:
+            await conn.run_sync(self.item_model.__table__.create)
 
     def get_pk_filter_condition(
         self, pk_dict: GeneralItemModelType | QueryParamType
@@ -227,6 +233,17 @@ class Warehouse(Base):  # type: ignore[misc]
 
         return self._ITEM_MODELS[self.name]
 
+    @property
+    def item_field_names(self) -> frozenset[str]:
+        """Get the names of the columns in this warehouse's item table."""
+
+        if self.name not in self._ITEM_FIELD_NAMES:
+            self._ITEM_FIELD_NAMES[self.name] = frozenset(
+                self.item_model.__table__.columns.keys()
+            )
+
+        return self._ITEM_FIELD_NAMES[self.name]
+
     @property
     def item_schema_class(self) -> ItemBase:
         """Create a Pydantic schema from the SQLAlchemy model."""
@@ -298,16 +315,19 @@ class Warehouse(Base):  # type: ignore[misc]
     def pk(self) -> tuple[InstrumentedAttribute, ...]:
         """Get primary key field(s) for this warehouse."""
 
-        return tuple(
-            getattr(self.item_model, pk.name)
-            for pk in inspect(self.item_model).primary_key
-        )
+        if self.name not in self._ITEM_PKS:
+            self._ITEM_PKS[self.name] = tuple(
+                getattr(self.item_model, pk.name)
+                for pk in inspect(self.item_model).primary_key
+            )
+
+        return self._ITEM_PKS[self.name]
 
     @property
     def pk_name(self) -> tuple[str, ...]:
         """Get the name of the primary key field(s) for this warehouse."""
 
-        return tuple(pk.name for pk in inspect(self.item_model).primary_key)
+        return tuple(pk.key for pk in self.pk)
 
 
 class _Page(BaseModel):
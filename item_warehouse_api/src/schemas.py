@@ -66,8 +66,8 @@ ItemAttributeType = (
 
 PythonType = int | str | datetime | date | bool | dict[str, Any] | float | None
 
-STRING_REQUIRES_LENGTH = (
-    getenv("DATABASE_DRIVER_NAME", "+pymysql").split("+")[-1] == "pymysql"
+STRING_REQUIRES_LENGTH = getenv("DATABASE_DRIVER_NAME", "+pymysql").endswith(
+    ("+pymysql", "+aiomysql")
 )
 
 
@@ -114,7 +114,7 @@ class DisplayType(StrEnum):
         }[name]
 
 
-ITEM_TYPE_TYPES = tuple(item_type.value for item_type in ItemType)
+ITEM_TYPE_TYPES = frozenset(item_type.value for item_type in ItemType)
 
 SQL_NAME_PATTERN = re_compile(r"^[a-zA-Z0-9_]+$")
 